@@ -6,46 +6,62 @@ it contains the expected interactive functionality.
 """
 
 from rh import MeshBuilder
+import os
+import re
+import sys
 import tempfile
 from pathlib import Path
 
+# A simple test case
+_MESH_SPEC = {
+    "fahrenheit": ["celsius"],
+    "kelvin": ["celsius"],
+    "area": ["radius"],
+    "slider_size": [],
+    "readonly_summary": ["area", "slider_size"],
+}
+
+_FUNCTIONS_SPEC = {
+    "fahrenheit": "return celsius * 9/5 + 32;",
+    "kelvin": "return celsius + 273.15;",
+    "area": "return Math.PI * radius * radius;",
+    "readonly_summary": "return `Area: ${area.toFixed(2)}, Size: ${slider_size}`;",
+}
+
+_INITIAL_VALUES = {"celsius": 20.0, "radius": 5.0, "slider_size": 50}
+
+_FIELD_OVERRIDES = {
+    "celsius": {
+        "title": "Temperature (°C)",
+        "ui:help": "Enter temperature in Celsius",
+    },
+    "radius": {"title": "Circle Radius", "minimum": 0, "maximum": 100},
+}
+
+# (label, needle, case_insensitive) for the HTML structure check
+_CHECKS = (
+    ("DOCTYPE", "<!DOCTYPE html>", False),
+    ("Title", "Manual Test App", False),
+    ("React", "react", True),
+    ("RJSF", "@rjsf/core", False),
+    ("Mesh Functions", "meshFunctions", False),
+    ("Propagator", "MeshPropagator", False),
+    ("Form Config", "formConfig", False),
+    ("Celsius Function", "celsius * 9/5 + 32", False),
+    ("Area Function", "Math.PI * radius * radius", False),
+)
+
 
 def main():
     print("🧪 Manual Test: Verifying Generated HTML")
     print("=" * 50)
 
-    # Create a simple test case
-    mesh_spec = {
-        "fahrenheit": ["celsius"],
-        "kelvin": ["celsius"],
-        "area": ["radius"],
-        "slider_size": [],
-        "readonly_summary": ["area", "slider_size"],
-    }
-
-    functions_spec = {
-        "fahrenheit": "return celsius * 9/5 + 32;",
-        "kelvin": "return celsius + 273.15;",
-        "area": "return Math.PI * radius * radius;",
-        "readonly_summary": "return `Area: ${area.toFixed(2)}, Size: ${slider_size}`;",
-    }
-
-    initial_values = {"celsius": 20.0, "radius": 5.0, "slider_size": 50}
-
-    field_overrides = {
-        "celsius": {
-            "title": "Temperature (°C)",
-            "ui:help": "Enter temperature in Celsius",
-        },
-        "radius": {"title": "Circle Radius", "minimum": 0, "maximum": 100},
-    }
-
     with tempfile.TemporaryDirectory() as tmpdir:
         builder = MeshBuilder(
-            mesh_spec=mesh_spec,
-            functions_spec=functions_spec,
-            initial_values=initial_values,
-            field_overrides=field_overrides,
+            mesh_spec=_MESH_SPEC,
+            functions_spec=_FUNCTIONS_SPEC,
+            initial_values=_INITIAL_VALUES,
+            field_overrides=_FIELD_OVERRIDES,
             output_dir=tmpdir,
         )
 
@@ -53,7 +69,7 @@ def main():
         config = builder.generate_config()
 
         print(f"  Variables: {list(config['schema']['properties'].keys())}")
-        print(f"  Functions: {list(functions_spec.keys())}")
+        print(f"  Functions: {list(_FUNCTIONS_SPEC.keys())}")
 
         print("\n🔄 Propagation Rules:")
         reverse_mesh = config["propagation_rules"]["reverseMesh"]
@@ -70,32 +86,27 @@ def main():
         app_path = builder.build_app(title="Manual Test App")
 
         print(f"✅ App created: {app_path}")
-        print(f"📄 File size: {app_path.stat().st_size} bytes")
-
-        # Display key sections of the HTML
-        html_content = app_path.read_text()
-
-        print("\n🔍 HTML Structure Check:")
-        checks = [
-            ("DOCTYPE", "<!DOCTYPE html>" in html_content),
-            ("Title", "Manual Test App" in html_content),
-            ("React", "react" in html_content.lower()),
-            ("RJSF", "@rjsf/core" in html_content),
-            ("Mesh Functions", "meshFunctions" in html_content),
-            ("Propagator", "MeshPropagator" in html_content),
-            ("Form Config", "formConfig" in html_content),
-            ("Celsius Function", "celsius * 9/5 + 32" in html_content),
-            ("Area Function", "Math.PI * radius * radius" in html_content),
-        ]
 
-        for check_name, passes in checks:
-            status = "✅" if passes else "❌"
-            print(f"  {status} {check_name}")
+        # One open, one fstat and one read on the same descriptor
+        with open(app_path, "rb", buffering=0) as f:
+            size = os.fstat(f.fileno()).st_size
+            html_content = f.read(size).decode("utf-8")
+        print(f"📄 File size: {size} bytes")
+
+        checks = {
+            label: (
+                needle.lower() in html_content.lower() if ci else needle in html_content
+            )
+            for label, needle, ci in _CHECKS
+        }
+        report = [
+            f"  {'✅' if passes else '❌'} {name}" for name, passes in checks.items()
+        ]
+        sys.stdout.write("\n🔍 HTML Structure Check:\n" + "\n".join(report) + "\n")
 
         print("\n📋 Sample HTML Sections:")
 
         # Extract and show the mesh configuration
-        import re
         import json
 
         config_match = re.search(
@@ -3,7 +3,7 @@ Example showing how to use RH_APP_FOLDER for persistent app storage.
 """
 
 from rh import MeshBuilder
-from rh.util import RH_APP_FOLDER, get_app_directory
+from rh.util import get_app_folder, get_app_directory
 import os
 
 
@@ -12,7 +12,7 @@ def create_persistent_apps():
 
     print("🗂️  RH App Directory Management")
     print("=" * 50)
-    print(f"📁 RH_APP_FOLDER: {RH_APP_FOLDER}")
+    print(f"📁 RH_APP_FOLDER: {get_app_folder()}")
     print()
 
     # Create a simple calculator app
@@ -80,9 +80,10 @@ def create_persistent_apps():
 
     # Show what's in the apps folder
     print("📂 Apps in RH_APP_FOLDER:")
-    if os.path.exists(RH_APP_FOLDER):
-        for item in os.listdir(RH_APP_FOLDER):
-            item_path = os.path.join(RH_APP_FOLDER, item)
+    app_folder = get_app_folder()
+    if os.path.exists(app_folder):
+        for item in os.listdir(app_folder):
+            item_path = os.path.join(app_folder, item)
             if os.path.isdir(item_path):
                 print(f"   📁 {item}/")
                 if os.path.exists(os.path.join(item_path, "index.html")):
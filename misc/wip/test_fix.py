@@ -5,6 +5,16 @@ Test the fixed temperature converter.
 from rh import MeshBuilder
 import tempfile
 
+# Components the generated page must contain (check name -> marker)
+_COMPONENT_CHECKS = {
+    "Form constant": "const Form = JSONSchemaForm.default;",
+    "Validator fix": "JSONSchemaForm.validator.ajv8",
+    "FormConfig": "const formConfig = ",
+    "onChange handler": "const onChange = ",
+    "renderForm function": "function renderForm(",
+    "Initial render call": "renderForm();",
+}
+
 
 def test_fixed_app():
     """Test the temperature converter with the validator fix."""
@@ -44,17 +54,8 @@ def test_fixed_app():
         print("\n🔍 JavaScript Analysis:")
 
         # Check if all necessary components are present
-        checks = [
-            ("Form constant", "const Form = JSONSchemaForm.default;" in html_content),
-            ("Validator fix", "JSONSchemaForm.validator.ajv8" in html_content),
-            ("FormConfig", "const formConfig = " in html_content),
-            ("onChange handler", "const onChange = " in html_content),
-            ("renderForm function", "function renderForm(" in html_content),
-            ("Initial render call", "renderForm();" in html_content),
-        ]
-
-        for check_name, passed in checks:
-            assert passed, f"Check failed: {check_name}"
+        for check_name, needle in _COMPONENT_CHECKS.items():
+            assert needle in html_content, f"Check failed: {check_name}"
 
         # Basic smoke: ensure file exists and contains expected render hook
         assert app_path.exists()
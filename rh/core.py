@@ -6,10 +6,23 @@ computational meshes with interactive web interfaces.
 """
 
 from dataclasses import dataclass, field
+from functools import cached_property
 from typing import Dict, Any, Optional
 from pathlib import Path
 import os
 
+# Fields whose reassignment invalidates ``MeshBuilder.config``
+_CONFIG_INPUTS = frozenset(
+    {
+        "mesh_spec",
+        "mesh",
+        "functions_spec",
+        "initial_values",
+        "field_overrides",
+        "ui_config",
+    }
+)
+
 
 @dataclass
 class MeshBuilder:
@@ -30,6 +43,17 @@ class MeshBuilder:
         """Initialize the mesh after construction."""
         self.mesh = self._parse_mesh(self.mesh_spec)
 
+    def __setattr__(self, name, value):
+        """Drop the cached ``config`` when one of its inputs is reassigned.
+
+        Reassigning ``mesh_spec`` also re-parses ``mesh`` from it.
+        """
+        super().__setattr__(name, value)
+        if name == "mesh_spec":
+            self.mesh = self._parse_mesh(value)
+        if name in _CONFIG_INPUTS:
+            self.__dict__.pop("config", None)
+
     def _get_output_dir(self, app_name: str | None = None) -> str:
         """Get the output directory for the app.
 
@@ -43,13 +67,9 @@ class MeshBuilder:
         if self.output_dir:
             return self.output_dir
         else:
-            # Import here to allow dynamic updates during testing
-            from .util import RH_APP_FOLDER
+            from .util import get_app_directory
 
-            if app_name:
-                return os.path.join(RH_APP_FOLDER, app_name)
-            else:
-                return os.path.join(RH_APP_FOLDER, "default_app")
+            return get_app_directory(app_name or "default_app")
 
     def _parse_mesh(self, mesh_spec: dict[str, Any]) -> dict[str, Any]:
         """Parse mesh specification from various formats.
@@ -77,6 +97,17 @@ class MeshBuilder:
 
         return config
 
+    @cached_property
+    def config(self) -> dict[str, Any]:
+        """The configuration from ``generate_config``, cached until an input changes.
+
+        Reassigning ``mesh_spec``, ``mesh``, ``functions_spec``,
+        ``initial_values``, ``field_overrides`` or ``ui_config`` drops the
+        cache. Mutating one of those dicts in place does not; use
+        ``del builder.config`` in that case.
+        """
+        return self.generate_config()
+
     def _generate_json_schema(self) -> dict[str, Any]:
         """Generate JSON Schema from mesh and initial values."""
         all_variables = self._get_all_variables()
@@ -199,10 +230,8 @@ class MeshBuilder:
 
     def _get_all_variables(self) -> set:
         """Get all variables (inputs and outputs) in the mesh."""
-        variables = set(self.mesh.keys())  # Output variables
-        for args in self.mesh.values():
-            variables.update(args)  # Input variables
-        return variables
+        # Output variables (the mesh keys) plus every input they depend on
+        return set(self.mesh).union(*self.mesh.values())
 
     def _resolve_functions(self) -> str:
         """Resolve and bundle JavaScript functions."""
@@ -272,7 +301,7 @@ class MeshBuilder:
         """
         from .generators.html import HTMLGenerator
 
-        config = self.generate_config()
+        config = self.config
 
         # Infer app_name from title if not provided
         if app_name is None:
@@ -285,11 +314,11 @@ class MeshBuilder:
         html_generator = HTMLGenerator()
         # Attach meta information to config for generator to render descriptions
         if meta:
-            config["meta"] = meta
+            config = {**config, "meta": meta}
         html_content = html_generator.generate_app(config, title, embed_rjsf=embed_rjsf)
 
         app_file = output_path / "index.html"
-        app_file.write_text(html_content)
+        app_file.write_bytes(html_content.encode("utf-8"))
 
         if serve:
             self.serve(output_dir, port=port)
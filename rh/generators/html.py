@@ -2,9 +2,44 @@
 HTML Generator for creating complete web applications from mesh configurations.
 """
 
+from functools import lru_cache
 from typing import Dict, Any
 from pathlib import Path
 import json
+import re
+
+_PLACEHOLDER_RE = re.compile(r"__([A-Z_]+)__")
+
+
+def _split_template(template: str) -> list[str]:
+    """Split a template on its ``__NAME__`` placeholders, once.
+
+    Even-indexed items are literal text and odd-indexed items are placeholder
+    names, which is the shape ``_render_template`` expects.
+    """
+    return _PLACEHOLDER_RE.split(template)
+
+
+def _render_template(parts: list[str], values: dict[str, str]) -> str:
+    """Fill a split template in one pass, with a single join.
+
+    Unlike chained ``str.replace`` calls, this copies the template once and
+    never substitutes placeholders that happen to appear inside ``values``.
+    """
+    return "".join(values[part] if i % 2 else part for i, part in enumerate(parts))
+
+
+@lru_cache(maxsize=None)
+def _read_vendor_script(vendor_path: Path) -> str | None:
+    """Return the contents of a vendor bundle, reading it from disk only once.
+
+    A missing bundle is cached too (as ``None``): one added later in the same
+    process is not picked up until ``_read_vendor_script.cache_clear()``, and
+    builds keep falling back to the CDN tag.
+    """
+    if vendor_path.exists():
+        return vendor_path.read_bytes().decode("utf-8")
+    return None
 
 
 class HTMLGenerator:
@@ -29,9 +64,9 @@ class HTMLGenerator:
         # Prepare vendor script: either embed deterministic UMD or use CDN tag
         vendor_script = None
         if embed_rjsf:
-            vendor_path = self.template_dir / "vendor" / "rjsf-umd.js"
-            if vendor_path.exists():
-                vendor_script = vendor_path.read_text(encoding="utf-8")
+            vendor_script = _read_vendor_script(
+                self.template_dir / "vendor" / "rjsf-umd.js"
+            )
 
         if vendor_script:
             vendor_tag = f"<script>{vendor_script}</script>"
@@ -55,11 +90,13 @@ class HTMLGenerator:
 
         # Build mesh config JS (mesh + reverseMesh)
         mesh = config.get("mesh") or {}
-        # Compute reverseMesh in Python to embed into the page
-        reverse = {}
-        for func_name, args in mesh.items():
-            for a in args:
-                reverse.setdefault(a, []).append(func_name)
+        # Reuse the reverseMesh MeshBuilder already computed, if present
+        reverse = (config.get("propagation_rules") or {}).get("reverseMesh")
+        if reverse is None:
+            reverse = {}
+            for func_name, args in mesh.items():
+                for a in args:
+                    reverse.setdefault(a, []).append(func_name)
 
         mesh_config = {"mesh": mesh, "reverseMesh": reverse}
         mesh_config_js = f"const meshConfig = {json.dumps(mesh_config)};"
@@ -67,7 +104,50 @@ class HTMLGenerator:
         mesh_propagator = self._generate_mesh_propagator_js(mesh_config_js)
         app_initialization = self._generate_app_initialization(config)
 
-        template = """<!DOCTYPE html>
+        # Add a demo description area populated from config.meta if available
+        demo_meta = config.get("meta", {}) if isinstance(config, dict) else {}
+        description_parts = []
+        if demo_meta:
+            desc = demo_meta.get("description") or demo_meta.get("summary") or ""
+            features = demo_meta.get("features") or []
+            if desc:
+                description_parts.append(f"<p>{desc}</p>")
+            if features:
+                description_parts.append("<ul>")
+                description_parts.extend(f"<li>{f}</li>" for f in features)
+                description_parts.append("</ul>")
+        description_html = "".join(description_parts)
+
+        return _render_template(
+            _APP_TEMPLATE_PARTS,
+            {
+                "TITLE": title,
+                "DESCRIPTION": description_html,
+                "VENDOR_SCRIPT_TAG": vendor_tag,
+                "MESH_FUNCTIONS": mesh_functions,
+                "MESH_PROPAGATOR": mesh_propagator,
+                "APP_INITIALIZATION": app_initialization,
+            },
+        )
+
+    def _generate_mesh_propagator_js(self, mesh_config_js: str) -> str:
+        """Generate the mesh propagator JavaScript class."""
+        return _MESH_PROPAGATOR_JS % mesh_config_js
+
+    def _generate_app_initialization(self, config: dict[str, Any]) -> str:
+        """Generate the main app initialization JavaScript."""
+        rjsf_config = {
+            "schema": config.get("schema", {}),
+            "uiSchema": config.get("uiSchema", {}),
+            "formData": config.get("initial_values", {}),
+        }
+
+        rjsf_json = json.dumps(rjsf_config)
+
+        return _APP_INITIALIZATION_JS % rjsf_json
+
+
+_APP_TEMPLATE = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -84,7 +164,7 @@ class HTMLGenerator:
     <div class="container-fluid">
         <div class="mesh-form-container">
             <h1>__TITLE__</h1>
-            <!-- DESCRIPTION_PLACEHOLDER -->
+            __DESCRIPTION__
             <div id="rjsf-form"></div>
         </div>
     </div>
@@ -188,35 +268,10 @@ class HTMLGenerator:
 </html>
 """
 
-        # Add a demo description area populated from config.meta if available
-        demo_meta = config.get("meta", {}) if isinstance(config, dict) else {}
-        description_html = ""
-        if demo_meta:
-            desc = demo_meta.get("description") or demo_meta.get("summary") or ""
-            features = demo_meta.get("features") or []
-            if desc:
-                description_html += f"<p>{desc}</p>"
-            if features:
-                description_html += "<ul>"
-                for f in features:
-                    description_html += f"<li>{f}</li>"
-                description_html += "</ul>"
-
-        html = (
-            template.replace("__TITLE__", title)
-            .replace("__VENDOR_SCRIPT_TAG__", vendor_tag)
-            .replace("__MESH_FUNCTIONS__", mesh_functions)
-            .replace("__MESH_PROPAGATOR__", mesh_propagator)
-            .replace("__APP_INITIALIZATION__", app_initialization)
-            .replace("<!-- DESCRIPTION_PLACEHOLDER -->", description_html)
-        )
+_APP_TEMPLATE_PARTS = _split_template(_APP_TEMPLATE)
 
-        return html
 
-    def _generate_mesh_propagator_js(self, mesh_config_js: str) -> str:
-        """Generate the mesh propagator JavaScript class."""
-        js = (
-            """class MeshPropagator {
+_MESH_PROPAGATOR_JS = """class MeshPropagator {
     constructor(mesh, functions, reverseMesh) {
         this.mesh = mesh;
         this.functions = functions;
@@ -271,29 +326,15 @@ class HTMLGenerator:
 }
 
 // Initialize mesh propagator with configuration
-"""
-            + mesh_config_js
-            + """
+%s
 const meshPropagator = new MeshPropagator(
     meshConfig.mesh,
     meshFunctions,
     meshConfig.reverseMesh
 );"""
-        )
-        return js
 
-    def _generate_app_initialization(self, config: dict[str, Any]) -> str:
-        """Generate the main app initialization JavaScript."""
-        rjsf_config = {
-            "schema": config.get("schema", {}),
-            "uiSchema": config.get("uiSchema", {}),
-            "formData": config.get("initial_values", {}),
-        }
-
-        rjsf_json = json.dumps(rjsf_config)
 
-        # Build a JS string by concatenation to avoid f-string brace issues
-        js = """// Initialize form with fallback support
+_APP_INITIALIZATION_JS = """// Initialize form with fallback support
 console.log('Starting app initialization...');
 
 if (typeof React === 'undefined') {
@@ -431,8 +472,4 @@ try {
     console.error('Error in app initialization:', error);
     document.getElementById('rjsf-form').innerHTML = '<div class="alert alert-danger">App initialization failed: ' + (error && error.message) + '</div>';
 }
-""" % (
-            rjsf_json
-        )
-
-        return js
+"""
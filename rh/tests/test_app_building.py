@@ -3,10 +3,13 @@ Tests for application building and HTML generation functionality.
 """
 
 import pytest
-import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
+# Minimal one-function mesh shared by the tests below (never mutated)
+_SIMPLE_MESH = {"output": ["input"]}
+_SIMPLE_FUNCTIONS = {"output": "return input;"}
+
 
 def test_build_components_from_config():
     """Test that components can be built from explicit config"""
@@ -43,7 +46,7 @@ def test_build_components_from_config():
     assert components["propagation_config"] == config["propagation_rules"]
 
 
-def test_build_app_creates_html_file():
+def test_build_app_creates_html_file(tmp_path):
     """Test that build_app creates an HTML file"""
     from rh import MeshBuilder
 
@@ -53,28 +56,27 @@ def test_build_app_creates_html_file():
 
     initial_values = {"input_value": 10}
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        builder = MeshBuilder(
-            mesh_spec=mesh_spec,
-            functions_spec=functions_spec,
-            initial_values=initial_values,
-            output_dir=tmpdir,
-        )
+    builder = MeshBuilder(
+        mesh_spec=mesh_spec,
+        functions_spec=functions_spec,
+        initial_values=initial_values,
+        output_dir=str(tmp_path),
+    )
 
-        app_path = builder.build_app(title="Test App")
+    app_path = builder.build_app(title="Test App")
 
-        # Should create an HTML file
-        assert app_path.exists()
-        assert app_path.suffix == ".html"
-        assert app_path.name == "index.html"
+    # Should create an HTML file
+    assert app_path.exists()
+    assert app_path.suffix == ".html"
+    assert app_path.name == "index.html"
 
-        # File should contain expected content
-        html_content = app_path.read_text()
-        assert "Test App" in html_content
-        assert "meshFunctions" in html_content
+    # File should contain expected content
+    html_content = app_path.read_text(encoding="utf-8")
+    assert "Test App" in html_content
+    assert "meshFunctions" in html_content
 
 
-def test_html_content_structure():
+def test_html_content_structure(tmp_path):
     """Test that generated HTML has the expected structure"""
     from rh import MeshBuilder
 
@@ -87,68 +89,103 @@ def test_html_content_structure():
 
     initial_values = {"celsius": 0}
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        builder = MeshBuilder(
-            mesh_spec=mesh_spec,
-            functions_spec=functions_spec,
-            initial_values=initial_values,
-            output_dir=tmpdir,
-        )
+    builder = MeshBuilder(
+        mesh_spec=mesh_spec,
+        functions_spec=functions_spec,
+        initial_values=initial_values,
+        output_dir=str(tmp_path),
+    )
 
-        app_path = builder.build_app(title="Temperature Converter")
-        html_content = app_path.read_text()
+    app_path = builder.build_app(title="Temperature Converter")
+    html_content = app_path.read_text(encoding="utf-8")
 
-        # Check for essential HTML structure
-        assert "<!DOCTYPE html>" in html_content
-        assert "<html" in html_content
-        assert "<head>" in html_content
-        assert "<body>" in html_content
-        assert "Temperature Converter" in html_content
+    # Check for essential HTML structure
+    assert "<!DOCTYPE html>" in html_content
+    assert "<html" in html_content
+    assert "<head>" in html_content
+    assert "<body>" in html_content
+    assert "Temperature Converter" in html_content
 
-        # Check for React and RJSF dependencies
-        assert "react" in html_content.lower()
-        assert "rjsf" in html_content.lower()
+    # Check for React and RJSF dependencies
+    assert "react" in html_content.lower()
+    assert "rjsf" in html_content.lower()
 
-        # Check for our generated JavaScript
-        assert "meshFunctions" in html_content
-        assert "fahrenheit" in html_content
-        assert "kelvin" in html_content
-        assert "celsius * 9/5 + 32" in html_content
+    # Check for our generated JavaScript
+    assert "meshFunctions" in html_content
+    assert "fahrenheit" in html_content
+    assert "kelvin" in html_content
+    assert "celsius * 9/5 + 32" in html_content
 
 
-def test_custom_output_directory():
-    """Test that build_app respects custom output directory"""
+def test_title_is_inserted_verbatim(tmp_path):
+    """Test that placeholder-like text in the title is not itself substituted"""
     from rh import MeshBuilder
 
-    mesh_spec = {"output": ["input"]}
-    functions_spec = {"output": "return input;"}
+    builder = MeshBuilder(
+        mesh_spec=_SIMPLE_MESH,
+        functions_spec=_SIMPLE_FUNCTIONS,
+        output_dir=str(tmp_path),
+    )
 
-    with tempfile.TemporaryDirectory() as tmpdir:
-        custom_dir = Path(tmpdir) / "custom" / "nested" / "path"
+    app_path = builder.build_app(title="About __MESH_FUNCTIONS__")
+    html_content = app_path.read_text(encoding="utf-8")
 
-        builder = MeshBuilder(
-            mesh_spec=mesh_spec,
-            functions_spec=functions_spec,
-            output_dir=str(custom_dir),
-        )
+    assert "<title>About __MESH_FUNCTIONS__</title>" in html_content
+    assert html_content.count("const meshFunctions") == 1
 
-        app_path = builder.build_app()
 
-        # Should create the directory structure
-        assert custom_dir.exists()
-        assert app_path.parent == custom_dir
-        assert app_path.exists()
+def test_embed_rjsf_inlines_vendor_bundle(tmp_path):
+    """Test that embed_rjsf inlines the vendor bundle instead of the CDN tag"""
+    from rh import MeshBuilder
+    from rh.generators.html import _read_vendor_script
+
+    mesh_spec = {"result": ["input_value"]}
+    functions_spec = {"result": "return input_value * 2;"}
+
+    builder = MeshBuilder(
+        mesh_spec=mesh_spec, functions_spec=functions_spec, output_dir=str(tmp_path)
+    )
+
+    # Build twice: the vendor bundle is read once and reused
+    _read_vendor_script.cache_clear()
+    for _ in range(2):
+        app_path = builder.build_app(title="Embedded App", embed_rjsf=True)
+        html_content = app_path.read_text(encoding="utf-8")
+
+        assert "Minimal deterministic UMD-like bundle" in html_content
+        assert "unpkg.com/react-jsonschema-form" not in html_content
+
+    cache_info = _read_vendor_script.cache_info()
+    assert cache_info.misses == 1
+    assert cache_info.hits >= 1
+
+
+def test_custom_output_directory(tmp_path):
+    """Test that build_app respects custom output directory"""
+    from rh import MeshBuilder
+
+    custom_dir = tmp_path / "custom" / "nested" / "path"
+
+    builder = MeshBuilder(
+        mesh_spec=_SIMPLE_MESH,
+        functions_spec=_SIMPLE_FUNCTIONS,
+        output_dir=str(custom_dir),
+    )
+
+    app_path = builder.build_app()
+
+    # Should create the directory structure
+    assert custom_dir.exists()
+    assert app_path.parent == custom_dir
+    assert app_path.exists()
 
 
 def test_mesh_builder_dataclass_defaults():
     """Test that MeshBuilder dataclass has proper defaults"""
     from rh import MeshBuilder
 
-    mesh_spec = {"output": ["input"]}
-    functions_spec = {"output": "return input;"}
-
     # Should work with minimal arguments
-    builder = MeshBuilder(mesh_spec=mesh_spec, functions_spec=functions_spec)
+    builder = MeshBuilder(mesh_spec=_SIMPLE_MESH, functions_spec=_SIMPLE_FUNCTIONS)
 
     # Check defaults
     assert builder.initial_values == {}
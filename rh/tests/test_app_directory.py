@@ -2,78 +2,51 @@
 Test the new app directory functionality. Promoted from misc/wip.
 """
 
-import tempfile
-import os
-from pathlib import Path
+import pytest
 from rh import MeshBuilder
 
+# Minimal one-function mesh shared by the tests below (never mutated)
+_SIMPLE_MESH = {"output": ["input"]}
+_SIMPLE_FUNCTIONS = {"output": "return input;"}
 
-def test_app_directory_naming():
-    """Test that apps are created with proper naming in RH_APP_FOLDER."""
-    mesh_spec = {"output": ["input"]}
-    functions_spec = {"output": "return input;"}
-
-    builder = MeshBuilder(mesh_spec=mesh_spec, functions_spec=functions_spec)
-
-    # Test app name inference from title
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Override environment variable for this test
-        original_env = os.environ.get("RH_APP_FOLDER")
-        os.environ["RH_APP_FOLDER"] = tmpdir
-
-        try:
-            # Reload util to pick up env change
-            import importlib
-            import rh.util
 
-            importlib.reload(rh.util)
-
-            # Test title inference
-            app_path = builder.build_app(title="Temperature Converter")
-            expected_path = Path(tmpdir) / "temperature_converter" / "index.html"
-            assert app_path == expected_path
-            assert app_path.exists()
+def test_app_directory_naming(monkeypatch, tmp_path):
+    """Test that apps are created with proper naming in RH_APP_FOLDER."""
+    builder = MeshBuilder(mesh_spec=_SIMPLE_MESH, functions_spec=_SIMPLE_FUNCTIONS)
 
-            # Test explicit app name
-            app_path2 = builder.build_app(title="My App", app_name="custom_name")
-            expected_path2 = Path(tmpdir) / "custom_name" / "index.html"
-            assert app_path2 == expected_path2
-            assert app_path2.exists()
+    # The app folder is read from the environment at call time, so no reload
+    monkeypatch.setenv("RH_APP_FOLDER", str(tmp_path))
 
-            # Test default app name
-            builder2 = MeshBuilder(mesh_spec=mesh_spec, functions_spec=functions_spec)
-            app_path3 = builder2.build_app()  # Default title "Mesh App"
-            expected_path3 = Path(tmpdir) / "mesh_app" / "index.html"
-            assert app_path3 == expected_path3
-            assert app_path3.exists()
+    # Test title inference
+    app_path = builder.build_app(title="Temperature Converter")
+    expected_path = tmp_path / "temperature_converter" / "index.html"
+    assert app_path == expected_path
+    assert app_path.exists()
 
-        finally:
-            # Restore original environment
-            if original_env is not None:
-                os.environ["RH_APP_FOLDER"] = original_env
-            elif "RH_APP_FOLDER" in os.environ:
-                del os.environ["RH_APP_FOLDER"]
+    # Test explicit app name
+    app_path2 = builder.build_app(title="My App", app_name="custom_name")
+    expected_path2 = tmp_path / "custom_name" / "index.html"
+    assert app_path2 == expected_path2
+    assert app_path2.exists()
 
-            # Reload to reset to original state
-            importlib.reload(rh.util)
+    # Test default app name
+    builder2 = MeshBuilder(mesh_spec=_SIMPLE_MESH, functions_spec=_SIMPLE_FUNCTIONS)
+    app_path3 = builder2.build_app()  # Default title "Mesh App"
+    expected_path3 = tmp_path / "mesh_app" / "index.html"
+    assert app_path3 == expected_path3
+    assert app_path3.exists()
 
 
-def test_output_dir_override():
+def test_output_dir_override(tmp_path):
     """Test that explicit output_dir overrides app directory logic."""
-    mesh_spec = {"output": ["input"]}
-    functions_spec = {"output": "return input;"}
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        builder = MeshBuilder(mesh_spec=mesh_spec, functions_spec=functions_spec)
-        builder.output_dir = tmpdir
+    builder = MeshBuilder(mesh_spec=_SIMPLE_MESH, functions_spec=_SIMPLE_FUNCTIONS)
+    builder.output_dir = str(tmp_path)
 
-        app_path = builder.build_app(title="Test App")
-        expected_path = Path(tmpdir) / "index.html"
-        assert app_path == expected_path
-        assert app_path.exists()
+    app_path = builder.build_app(title="Test App")
+    expected_path = tmp_path / "index.html"
+    assert app_path == expected_path
+    assert app_path.exists()
 
 
 if __name__ == "__main__":
-    test_app_directory_naming()
-    test_output_dir_override()
-    print("\u2705 All app directory tests passed!")
+    pytest.main([__file__])
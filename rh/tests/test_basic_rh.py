@@ -79,6 +79,54 @@ def test_generate_config():
     assert config["initial_values"]["temp_celsius"] == 20.0
 
 
+def test_config_is_generated_once():
+    """Test that the config property is cached and matches generate_config"""
+    from rh import MeshBuilder
+
+    builder = MeshBuilder(
+        mesh_spec={"temp_fahrenheit": ["temp_celsius"]},
+        functions_spec={"temp_fahrenheit": "return temp_celsius * 9/5 + 32;"},
+        initial_values={"temp_celsius": 20.0},
+    )
+
+    assert builder.config is builder.config
+    assert builder.config == builder.generate_config()
+
+
+def test_config_follows_reassigned_fields(tmp_path):
+    """Test that reassigning a builder field is picked up by the next build"""
+    from rh import MeshBuilder
+
+    builder = MeshBuilder(
+        mesh_spec={"temp_fahrenheit": ["temp_celsius"]},
+        functions_spec={"temp_fahrenheit": "return temp_celsius * 9/5 + 32;"},
+        initial_values={"temp_celsius": 20.0},
+        output_dir=str(tmp_path),
+    )
+    builder.build_app(title="Before")
+
+    builder.field_overrides = {"temp_celsius": {"title": "NEW TITLE"}}
+    app_path = builder.build_app(title="After")
+
+    assert builder.config == builder.generate_config()
+    assert "NEW TITLE" in app_path.read_text()
+
+
+def test_config_follows_reassigned_mesh():
+    """Test that reassigning mesh or mesh_spec regenerates the config"""
+    from rh import MeshBuilder
+
+    builder = MeshBuilder(mesh_spec={"y": ["x"]}, functions_spec={})
+    assert sorted(builder.config["schema"]["properties"]) == ["x", "y"]
+
+    builder.mesh = {"z": ["w"]}
+    assert sorted(builder.config["schema"]["properties"]) == ["w", "z"]
+
+    builder.mesh_spec = {"b": ["a"]}
+    assert builder.mesh == {"b": ["a"]}
+    assert sorted(builder.config["schema"]["properties"]) == ["a", "b"]
+
+
 def test_type_inference():
     """Test that types are inferred correctly from initial values"""
     from rh import MeshBuilder
@@ -2,13 +2,13 @@
 Test the exact demo scenario to ensure the fix works. Promoted from misc/wip.
 """
 
+import pytest
 from rh import MeshBuilder
-import tempfile
 import os
 from rh.util import process_path
 
 
-def test_demo_scenario():
+def test_demo_scenario(tmp_path):
     """Test the exact scenario from the demo that was failing."""
     mesh_spec = {
         "temp_fahrenheit": ["temp_celsius"],
@@ -26,22 +26,21 @@ def test_demo_scenario():
     builder = MeshBuilder(mesh_spec, functions_spec, initial_values)
 
     # Use temp directory for testing (as suggested in the original requirements)
-    with tempfile.TemporaryDirectory() as tmpdir:
-        builder.output_dir = tmpdir
+    builder.output_dir = str(tmp_path)
 
-        # Build the app
-        app_path = builder.build_app(title="Temperature Converter")
+    # Build the app
+    app_path = builder.build_app(title="Temperature Converter")
 
-        # Get the directory that serve() would try to use
-        serve_dir = tmpdir  # This is what builder.serve() would try to serve
+    # Get the directory that serve() would try to use
+    serve_dir = str(tmp_path)  # This is what builder.serve() would try to serve
 
-        # This should not fail now
-        processed_dir = process_path(serve_dir, ensure_dir_exists=True)
+    # This should not fail now
+    processed_dir = process_path(serve_dir, ensure_dir_exists=True)
 
-        # Verify directory exists and has the app
-        assert os.path.exists(processed_dir)
-        assert os.path.exists(app_path)
+    # Verify directory exists and has the app
+    assert os.path.exists(processed_dir)
+    assert os.path.exists(app_path)
 
 
 if __name__ == "__main__":
-    test_demo_scenario()
+    pytest.main([__file__])
@@ -3,11 +3,10 @@ Test that the examples in the README work correctly.
 """
 
 import pytest
-import tempfile
 from pathlib import Path
 
 
-def test_readme_quick_start_example():
+def test_readme_quick_start_example(tmp_path):
     """Test the quick start example from the README."""
     from rh import MeshBuilder
 
@@ -27,20 +26,19 @@ def test_readme_quick_start_example():
     initial_values = {"temp_celsius": 20.0}
 
     # Create and build the app
-    with tempfile.TemporaryDirectory() as tmpdir:
-        builder = MeshBuilder(mesh_spec, functions_spec, initial_values)
-        builder.output_dir = tmpdir
-        app_path = builder.build_app(title="Temperature Converter")
-
-        # Verify the app was created
-        assert app_path.exists()
-        assert app_path.suffix == ".html"
-
-        # Verify content
-        html_content = app_path.read_text()
-        assert "Temperature Converter" in html_content
-        assert "temp_celsius * 9/5 + 32" in html_content
-        assert "temp_celsius + 273.15" in html_content
+    builder = MeshBuilder(mesh_spec, functions_spec, initial_values)
+    builder.output_dir = str(tmp_path)
+    app_path = builder.build_app(title="Temperature Converter")
+
+    # Verify the app was created
+    assert app_path.exists()
+    assert app_path.suffix == ".html"
+
+    # Verify content
+    html_content = app_path.read_text(encoding="utf-8")
+    assert "Temperature Converter" in html_content
+    assert "temp_celsius * 9/5 + 32" in html_content
+    assert "temp_celsius + 273.15" in html_content
 
 
 def test_readme_ui_conventions_example():
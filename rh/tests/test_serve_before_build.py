@@ -2,13 +2,21 @@
 Test calling serve() before build_app() - promoted from misc/wip.
 """
 
+import pytest
 from rh import MeshBuilder
-import tempfile
 import os
+from pathlib import Path
 
 
-def test_serve_before_build_app():
-    """Test that serve() can be called before build_app() without crashing."""
+@pytest.mark.parametrize(
+    "explicit_output_dir", [True, False], ids=["output_dir", "default_app"]
+)
+def test_serve_before_build_app(explicit_output_dir, tmp_path, monkeypatch):
+    """Test that serve() can be called before build_app() without crashing.
+
+    Covers both an explicit ``output_dir`` and the ``default_app`` directory
+    under ``RH_APP_FOLDER`` used when none is set.
+    """
 
     mesh_spec = {
         "temp_fahrenheit": ["temp_celsius"],
@@ -22,32 +30,27 @@ def test_serve_before_build_app():
 
     initial_values = {"temp_celsius": 20.0}
 
-    # Test with a custom directory to avoid environment-specific paths
-    with tempfile.TemporaryDirectory() as tmpdir:
-        # Create builder and set explicit output directory
-        builder = MeshBuilder(mesh_spec, functions_spec, initial_values)
-        builder.output_dir = tmpdir
-
-        # Test the core fix: process_path should create missing directories
-        from rh.util import process_path
-
-        # Create a subdirectory that doesn't exist yet
-        test_serve_dir = os.path.join(tmpdir, "nonexistent_dir")
+    builder = MeshBuilder(mesh_spec, functions_spec, initial_values)
+    if explicit_output_dir:
+        expected_dir = tmp_path / "nonexistent_dir"
+        builder.output_dir = str(expected_dir)
+    else:
+        monkeypatch.setenv("RH_APP_FOLDER", str(tmp_path))
+        expected_dir = tmp_path / "default_app"
 
-        # This should create the directory (simulating what serve_directory does)
-        processed_dir = process_path(test_serve_dir, ensure_dir_exists=True)
+    serve_dir = builder._get_output_dir()
+    assert Path(serve_dir) == expected_dir
+    assert not expected_dir.exists()
 
-        # Verify the directory exists
-        assert os.path.exists(processed_dir), f"Directory should exist: {processed_dir}"
+    # This is what serve_directory does before serving
+    from rh.util import process_path
 
-        # Now test that _get_output_dir() logic works
-        serve_dir = builder._get_output_dir()
-        processed_serve_dir = process_path(serve_dir, ensure_dir_exists=True)
+    processed_serve_dir = process_path(serve_dir, ensure_dir_exists=True)
 
-        assert os.path.exists(
-            processed_serve_dir
-        ), f"Serve directory should exist: {processed_serve_dir}"
+    assert os.path.exists(
+        processed_serve_dir
+    ), f"Serve directory should exist: {processed_serve_dir}"
 
 
 if __name__ == "__main__":
-    test_serve_before_build_app()
+    pytest.main([__file__])
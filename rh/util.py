@@ -13,14 +13,32 @@ RH_LOCAL_DATA_FOLDER = os.environ.get(
     "RH_LOCAL_DATA_FOLDER", get_app_config_folder("rh")
 )
 RH_LOCAL_DATA_FOLDER = process_path(RH_LOCAL_DATA_FOLDER, ensure_dir_exists=True)
-RH_APP_FOLDER = os.environ.get(
-    "RH_APP_FOLDER", os.path.join(RH_LOCAL_DATA_FOLDER, "apps")
-)
-RH_APP_FOLDER = process_path(RH_APP_FOLDER, ensure_dir_exists=True)
+
+
+def get_app_folder() -> str:
+    """Get the folder where named apps are stored.
+
+    The ``RH_APP_FOLDER`` environment variable is read at call time (not at
+    import time), so it can be changed without reloading this module. The
+    folder is not created here; ``build_app`` creates the app directory it
+    writes to.
+
+    Returns:
+        Path to the apps folder
+    """
+    app_folder = os.environ.get(
+        "RH_APP_FOLDER", os.path.join(RH_LOCAL_DATA_FOLDER, "apps")
+    )
+    return process_path(app_folder)
+
+
+# Import-time snapshot of get_app_folder(), kept for backward compatibility.
+# It does not follow later changes to RH_APP_FOLDER; call get_app_folder().
+RH_APP_FOLDER = get_app_folder()
 
 
 def get_app_directory(app_name: str) -> str:
-    """Get a directory path for a named app within RH_APP_FOLDER.
+    """Get a directory path for a named app within the apps folder.
 
     Args:
         app_name: Name of the app
@@ -28,7 +46,7 @@ def get_app_directory(app_name: str) -> str:
     Returns:
         Full path to the app directory
     """
-    return os.path.join(RH_APP_FOLDER, app_name)
+    return os.path.join(get_app_folder(), app_name)
 
 
 def serve_directory(directory: str, port: int = 8080, host: str = "localhost"):